@@ -4,17 +4,35 @@ Moltbot Daily Report Generator for PelangiManager
 Generates and sends daily operations report at 9 AM Malaysia time
 """
 
+from __future__ import annotations
+
+import asyncio
+import http.client
+import httpx
 import requests
+import io
 import json
-import schedule
 import time
 from datetime import datetime
-import pytz
-from typing import Dict, List, Any, Optional
+from urllib.parse import urlsplit
+from zoneinfo import ZoneInfo
+
+# orjson is optional; fall back to stdlib json when it isn't installed
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+JSON_HEADERS = {"Content-Type": "application/json", "Connection": "keep-alive"}
 
 # Configuration
 MCP_URL = "http://localhost:3001/mcp"
-MALAYSIA_TZ = pytz.timezone('Asia/Kuala_Lumpur')
+MALAYSIA_TZ = ZoneInfo('Asia/Kuala_Lumpur')
 
 # Delivery configuration (choose your method)
 TELEGRAM_BOT_TOKEN = ""  # Your Telegram bot token
@@ -28,15 +46,146 @@ EMAIL_CONFIG = {
     "recipient": ""
 }
 
+# Report layout constants, built once at import
+_SEP55 = "═" * 55
+_SEP23 = "═" * 23
+_SEP27 = "═" * 27
+_SEP19 = "═" * 19
+
+_REPORT_HEADER = f"🏨 PELANGI CAPSULE HOSTEL - DAILY OPERATIONS REPORT\n{_SEP55}\n\n"
+_OCCUPANCY_HEADER = f"📊 OCCUPANCY STATISTICS\n{_SEP23}"
+_CAPSULE_HEADER = f"🛏️ CAPSULE STATUS BY SECTION\n{_SEP27}"
+_GUEST_HEADER = f"👥 GUEST INFORMATION\n{_SEP19}"
+_OVERDUE_HEADER = f"⚠️ OVERDUE GUESTS\n{_SEP19}"
+_MAINTENANCE_HEADER = f"🔧 MAINTENANCE STATUS\n{_SEP23}"
+_DATA_UNAVAILABLE = "\n⚠️ Data unavailable"
+
+# Precompiled %-templates for the fixed-shape sections
+_OCCUPANCY_TMPL = _OCCUPANCY_HEADER + (
+    "\nTotal Capsules: %(total)s"
+    "\nOccupied: %(occupied)s capsules"
+    "\nAvailable: %(available)s capsules"
+    "\nOccupancy Rate: %(occupancyRate)s%%"
+)
+_OCCUPANCY_DEFAULTS = {"total": 0, "occupied": 0, "available": 0, "occupancyRate": 0}
+_CAPSULE_BLOCK_TMPL = "%s SECTION (%d capsules):\n  Occupied: %s\n  Available: %s"
+_GUEST_TMPL = _GUEST_HEADER + "\nChecked-in Guests: %s"
+_OVERDUE_TMPL = _OVERDUE_HEADER + "\n⚠️ %d guest(s) past expected checkout:\n%s"
+_OVERDUE_LINE_TMPL = "\n  - %s (Capsule %s) - Expected: %s"
+_REPORT_FOOTER_TMPL = _SEP55 + "\n📅 Report Generated: %s\n🤖 Automated by Moltbot v1.0"
+
+# Per-tool cache TTL overrides in seconds (0 disables caching)
+# pelangi_list_capsules keeps the default: it carries live isAvailable flags,
+# so it must stay as fresh as the occupancy numbers it sits next to.
+TOOL_CACHE_TTL = {
+    "pelangi_export_whatsapp_issues": 0,   # maintenance issues must be fresh
+}
+
+# Shared keep-alive session for Telegram/WhatsApp delivery
+_DELIVERY_SESSION = requests.Session()
+_DELIVERY_SESSION.headers.update(JSON_HEADERS)
+
+# Telegram rejects messages over 4096 chars; leave headroom
+TELEGRAM_CHUNK_SIZE = 4000
+
+
+def _chunk_message(text: str, limit: int = TELEGRAM_CHUNK_SIZE) -> list[str]:
+    """Split text into chunks of at most `limit` chars, preferring blank-line boundaries"""
+    if len(text) <= limit:
+        return [text]
+
+    chunks = []
+    current = ""
+    for block in text.split("\n\n"):
+        candidate = f"{current}\n\n{block}" if current else block
+        if len(candidate) <= limit:
+            current = candidate
+            continue
+
+        if current:
+            chunks.append(current)
+        # A single block longer than the limit is split on its last newline
+        # within the limit, falling back to a hard cut for one overlong line
+        while len(block) > limit:
+            cut = block.rfind("\n", 0, limit + 1)
+            if cut <= 0:
+                chunks.append(block[:limit])
+                block = block[limit:]
+            else:
+                chunks.append(block[:cut])
+                block = block[cut + 1:]
+        current = block
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 class MCPClient:
     """Client for interacting with PelangiManager MCP Server"""
 
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, cache_ttl: float = 60):
         self.base_url = base_url
         self.request_id = 0
 
-    def call_tool(self, tool_name: str, arguments: Dict = None) -> Dict:
+        # Health probe target, parsed once; the raw connection is reused across retries
+        parts = urlsplit(base_url)
+        self._health_conn_cls = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._health_host = parts.hostname
+        self._health_port = parts.port
+        self._health_path = parts.path.replace('/mcp', '/health')
+        self._health_conn: http.client.HTTPConnection | None = None
+
+        # TTL cache of tool results keyed by (tool_name, arguments)
+        self.cache_ttl = cache_ttl
+        self._cache: dict[tuple, tuple] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        # Pooled async client. httpx only negotiates HTTP/2 over TLS (ALPN), so
+        # concurrent calls are multiplexed on one connection for HTTPS deployments
+        # only; plain http (e.g. localhost) uses HTTP/1.1 keep-alive connections.
+        # Created lazily on first call, since the client may sit idle for a day.
+        self.client: httpx.AsyncClient | None = None
+
+    @staticmethod
+    def _create_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            headers={"Content-Type": "application/json"},
+            timeout=30.0
+        )
+
+    async def aclose(self):
+        """Close pooled connections; a fresh client is opened on the next call"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def call_tool(self, tool_name: str, arguments: dict | None = None) -> dict:
         """Call an MCP tool and return the result"""
+        ttl = TOOL_CACHE_TTL.get(tool_name, self.cache_ttl)
+        cache_key = (tool_name, frozenset((arguments or {}).items()))
+
+        if ttl > 0:
+            cached = self._cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                self._cache_hits += 1
+                return cached[1]
+            self._cache_misses += 1
+
+        result = await self._request_tool(tool_name, arguments)
+
+        if ttl > 0 and "error" not in result:
+            self._cache[cache_key] = (time.monotonic(), result)
+
+        return result
+
+    async def _request_tool(self, tool_name: str, arguments: dict | None = None) -> dict:
+        """Send a tools/call request to the MCP server"""
         self.request_id += 1
 
         payload = {
@@ -50,14 +199,11 @@ class MCPClient:
         }
 
         try:
-            response = requests.post(
-                self.base_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
+            if self.client is None:
+                self.client = self._create_client()
+            response = await self.client.post(self.base_url, content=_dumps(payload))
             response.raise_for_status()
-            result = response.json()
+            result = _loads(response.content)
 
             if "error" in result:
                 raise Exception(f"MCP Error: {result['error']}")
@@ -67,26 +213,54 @@ class MCPClient:
                 content = result["result"]["content"]
                 if content and len(content) > 0:
                     text = content[0].get("text", "{}")
+                    # Tool failures come back as plain text flagged isError; surface them
+                    # as errors so the section shows "Data unavailable" and isn't cached
+                    if result["result"].get("isError"):
+                        print(f"MCP tool {tool_name} failed: {text}")
+                        return {"error": text}
                     try:
-                        return json.loads(text)
-                    except json.JSONDecodeError:
+                        return _loads(text)
+                    except ValueError:
                         return {"raw": text}
 
             return result
 
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
             print(f"Error calling MCP tool {tool_name}: {e}")
             return {"error": str(e)}
 
+    def get_cache_stats(self) -> dict:
+        """Return cache hit/miss counters for monitoring"""
+        total = self._cache_hits + self._cache_misses
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._cache),
+            "hitRate": round(self._cache_hits / total * 100, 1) if total else 0
+        }
+
     def health_check(self) -> bool:
-        """Check if MCP server is healthy"""
+        """Check if MCP server is healthy (HEAD request, no body read)"""
         try:
-            health_url = self.base_url.replace('/mcp', '/health')
-            response = requests.get(health_url, timeout=5)
-            return response.status_code == 200
-        except:
+            if self._health_conn is None:
+                self._health_conn = self._health_conn_cls(
+                    self._health_host, self._health_port, timeout=5
+                )
+            self._health_conn.request("HEAD", self._health_path)
+            response = self._health_conn.getresponse()
+            response.close()
+            return response.status == 200
+        except (OSError, http.client.HTTPException):
+            # Drop the broken connection so the next attempt reconnects
+            self.close_health_conn()
             return False
 
+    def close_health_conn(self):
+        """Close the reusable health probe connection"""
+        if self._health_conn is not None:
+            self._health_conn.close()
+            self._health_conn = None
+
 
 class ReportGenerator:
     """Generates formatted daily reports from MCP data"""
@@ -94,144 +268,141 @@ class ReportGenerator:
     def __init__(self, mcp_client: MCPClient):
         self.mcp = mcp_client
 
-    def generate_report(self) -> str:
+    async def generate_report(self, now: datetime | None = None) -> str:
         """Generate complete daily report"""
-        timestamp = datetime.now(MALAYSIA_TZ).strftime("%Y-%m-%d %H:%M:%S GMT+8")
+        now = now or datetime.now(MALAYSIA_TZ)
+        timestamp = now.strftime("%Y-%m-%d %H:%M:%S GMT+8")
+
+        # The MCP calls are independent, so fetch them concurrently
+        occupancy, capsules, guests, overdue, maintenance = await asyncio.gather(
+            self._fetch_occupancy(),
+            self._fetch_capsules(),
+            self._fetch_guests(),
+            self._fetch_overdue(),
+            self._fetch_maintenance()
+        )
 
-        report = []
-        report.append("🏨 PELANGI CAPSULE HOSTEL - DAILY OPERATIONS REPORT")
-        report.append("═" * 55)
-        report.append("")
+        buf = io.StringIO()
+        buf.write(_REPORT_HEADER)
 
         # Section 1: Occupancy Statistics
-        occupancy_section = self._generate_occupancy_section()
-        report.append(occupancy_section)
-        report.append("")
+        buf.write(self._format_occupancy_section(occupancy))
+        buf.write("\n\n")
 
         # Section 2: Capsule Status by Section
-        capsule_section = self._generate_capsule_section()
-        report.append(capsule_section)
-        report.append("")
+        buf.write(self._format_capsule_section(capsules))
+        buf.write("\n\n")
 
         # Section 3: Guest Information
-        guest_section = self._generate_guest_section()
-        report.append(guest_section)
-        report.append("")
+        buf.write(self._format_guest_section(guests))
+        buf.write("\n\n")
 
         # Section 4: Overdue Guests
-        overdue_section = self._generate_overdue_section()
-        report.append(overdue_section)
-        report.append("")
+        buf.write(self._format_overdue_section(overdue))
+        buf.write("\n\n")
 
         # Section 5: Maintenance Status
-        maintenance_section = self._generate_maintenance_section()
-        report.append(maintenance_section)
-        report.append("")
+        buf.write(self._format_maintenance_section(maintenance))
+        buf.write("\n\n")
 
         # Footer
-        report.append("═" * 55)
-        report.append(f"📅 Report Generated: {timestamp}")
-        report.append("🤖 Automated by Moltbot v1.0")
-
-        return "\n".join(report)
+        buf.write(_REPORT_FOOTER_TMPL % timestamp)
 
-    def _generate_occupancy_section(self) -> str:
-        """Generate occupancy statistics section"""
-        data = self.mcp.call_tool("pelangi_get_occupancy")
-
-        if "error" in data:
-            return "📊 OCCUPANCY STATISTICS\n═══════════════════════\n⚠️ Data unavailable"
+        return buf.getvalue()
 
-        total = data.get("total", 0)
-        occupied = data.get("occupied", 0)
-        available = data.get("available", 0)
-        rate = data.get("occupancyRate", 0)
+    async def _fetch_occupancy(self) -> dict:
+        """Fetch occupancy statistics from MCP"""
+        return await self.mcp.call_tool("pelangi_get_occupancy")
 
-        return f"""📊 OCCUPANCY STATISTICS
-═══════════════════════
-Total Capsules: {total}
-Occupied: {occupied} capsules
-Available: {available} capsules
-Occupancy Rate: {rate}%"""
+    async def _fetch_capsules(self) -> dict:
+        """Fetch capsule list from MCP"""
+        return await self.mcp.call_tool("pelangi_list_capsules")
 
-    def _generate_capsule_section(self) -> str:
-        """Generate capsule status breakdown by section"""
-        capsules = self.mcp.call_tool("pelangi_list_capsules")
+    async def _fetch_guests(self) -> dict:
+        """Fetch checked-in guest count from MCP"""
+        # Only the count is reported, so request a single record and read pagination.total
+        return await self.mcp.call_tool("pelangi_list_guests", {"page": 1, "limit": 1})
 
-        if "error" in capsules or not isinstance(capsules, list):
-            return "🛏️ CAPSULE STATUS BY SECTION\n═══════════════════════════\n⚠️ Data unavailable"
+    async def _fetch_overdue(self) -> dict:
+        """Fetch overdue guest list from MCP"""
+        return await self.mcp.call_tool("pelangi_get_overdue_guests")
 
-        # Organize by section
-        sections = {"back": [], "middle": [], "front": []}
+    async def _fetch_maintenance(self) -> dict:
+        """Fetch WhatsApp-formatted maintenance issues from MCP"""
+        return await self.mcp.call_tool("pelangi_export_whatsapp_issues")
 
-        for capsule in capsules:
-            section = capsule.get("section", "unknown")
-            if section in sections:
-                sections[section].append(capsule)
+    def _format_occupancy_section(self, data) -> str:
+        """Generate occupancy statistics section"""
+        if "error" in data:
+            return _OCCUPANCY_HEADER + _DATA_UNAVAILABLE
 
-        output = ["🛏️ CAPSULE STATUS BY SECTION", "═══════════════════════════", ""]
+        # Missing keys fall back to 0
+        return _OCCUPANCY_TMPL % {**_OCCUPANCY_DEFAULTS, **data}
 
-        for section_name, capsule_list in sections.items():
-            if not capsule_list:
-                continue
+    def _format_capsule_section(self, capsules) -> str:
+        """Generate capsule status breakdown by section"""
+        if "error" in capsules or not isinstance(capsules, list):
+            return _CAPSULE_HEADER + _DATA_UNAVAILABLE
 
-            occupied = [c["number"] for c in capsule_list if not c.get("isAvailable")]
-            available = [c["number"] for c in capsule_list if c.get("isAvailable")]
+        # Single pass: bucket capsule numbers into (occupied, available) per section.
+        # Capsules with a missing or unrecognised section land in "unknown".
+        sections = {"back": ([], []), "middle": ([], []), "front": ([], []), "unknown": ([], [])}
+        unknown = sections["unknown"]
 
-            section_title = section_name.upper() + " SECTION"
-            output.append(f"{section_title} ({len(capsule_list)} capsules):")
-            output.append(f"  Occupied: {', '.join(occupied) if occupied else 'None'}")
-            output.append(f"  Available: {', '.join(available) if available else 'None'}")
-            output.append("")
+        for capsule in capsules:
+            buckets = sections.get(capsule.get("section"), unknown)
+            buckets[1 if capsule.get("isAvailable") else 0].append(capsule["number"])
+
+        section_strs = [
+            _CAPSULE_BLOCK_TMPL % (
+                section_name.upper(),
+                len(occupied) + len(available),
+                ', '.join(occupied) if occupied else 'None',
+                ', '.join(available) if available else 'None'
+            )
+            for section_name, (occupied, available) in sections.items()
+            if occupied or available
+        ]
 
-        return "\n".join(output).rstrip()
+        return (_CAPSULE_HEADER + "\n\n" + "\n\n".join(section_strs)).rstrip()
 
-    def _generate_guest_section(self) -> str:
+    def _format_guest_section(self, guests) -> str:
         """Generate guest information section"""
-        guests = self.mcp.call_tool("pelangi_list_guests", {"page": 1, "limit": 100})
-
         if "error" in guests:
-            return "👥 GUEST INFORMATION\n═══════════════════\n⚠️ Data unavailable"
+            return _GUEST_HEADER + _DATA_UNAVAILABLE
 
         # Handle paginated response
         guest_count = 0
         if isinstance(guests, dict) and "data" in guests:
-            guest_count = len(guests["data"])
+            guest_count = guests.get("pagination", {}).get("total", len(guests["data"]))
         elif isinstance(guests, list):
             guest_count = len(guests)
 
-        return f"""👥 GUEST INFORMATION
-═══════════════════
-Checked-in Guests: {guest_count}"""
+        return _GUEST_TMPL % guest_count
 
-    def _generate_overdue_section(self) -> str:
+    def _format_overdue_section(self, overdue) -> str:
         """Generate overdue guests section"""
-        overdue = self.mcp.call_tool("pelangi_get_overdue_guests")
-
         if "error" in overdue:
-            return "⚠️ OVERDUE GUESTS\n═══════════════════\n⚠️ Data unavailable"
+            return _OVERDUE_HEADER + _DATA_UNAVAILABLE
 
         if not overdue or len(overdue) == 0:
-            return "⚠️ OVERDUE GUESTS\n═══════════════════\n✅ No overdue guests"
-
-        output = ["⚠️ OVERDUE GUESTS", "═══════════════════"]
-        output.append(f"⚠️ {len(overdue)} guest(s) past expected checkout:")
-        output.append("")
+            return _OVERDUE_HEADER + "\n✅ No overdue guests"
 
-        for guest in overdue:
-            name = guest.get("name", "Unknown")
-            capsule = guest.get("capsuleNumber", "N/A")
-            expected = guest.get("expectedCheckoutDate", "N/A")
-            output.append(f"  - {name} (Capsule {capsule}) - Expected: {expected}")
+        guest_lines = "".join(
+            _OVERDUE_LINE_TMPL % (
+                guest.get('name', 'Unknown'),
+                guest.get('capsuleNumber', 'N/A'),
+                guest.get('expectedCheckoutDate', 'N/A')
+            )
+            for guest in overdue
+        )
 
-        return "\n".join(output)
+        return _OVERDUE_TMPL % (len(overdue), guest_lines)
 
-    def _generate_maintenance_section(self) -> str:
+    def _format_maintenance_section(self, whatsapp_format) -> str:
         """Generate maintenance status section"""
-        whatsapp_format = self.mcp.call_tool("pelangi_export_whatsapp_issues")
-
         if "error" in whatsapp_format:
-            return "🔧 MAINTENANCE STATUS\n═══════════════════════\n⚠️ Data unavailable"
+            return _MAINTENANCE_HEADER + _DATA_UNAVAILABLE
 
         # Extract the raw WhatsApp formatted text
         if isinstance(whatsapp_format, dict) and "raw" in whatsapp_format:
@@ -239,7 +410,7 @@ Checked-in Guests: {guest_count}"""
         elif isinstance(whatsapp_format, str):
             return whatsapp_format
 
-        return "🔧 MAINTENANCE STATUS\n═══════════════════════\n✅ No active maintenance issues"
+        return _MAINTENANCE_HEADER + "\n✅ No active maintenance issues"
 
 
 class ReportDelivery:
@@ -253,15 +424,18 @@ class ReportDelivery:
             return False
 
         url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        payload = {
-            "chat_id": chat_id,
-            "text": report,
-            "parse_mode": "Markdown"
-        }
 
         try:
-            response = requests.post(url, json=payload)
-            response.raise_for_status()
+            # Long reports go out as several messages over the same keep-alive connection.
+            # Markdown is only used for single messages: a split can separate a
+            # */_/` pair, and Telegram would reject the later chunk mid-delivery.
+            chunks = _chunk_message(report)
+            for chunk in chunks:
+                payload = {"chat_id": chat_id, "text": chunk}
+                if len(chunks) == 1:
+                    payload["parse_mode"] = "Markdown"
+                response = _DELIVERY_SESSION.post(url, data=_dumps(payload))
+                response.raise_for_status()
             print("✅ Report sent via Telegram")
             return True
         except Exception as e:
@@ -279,7 +453,7 @@ class ReportDelivery:
         # Example for Periskope or other providers
         try:
             # Customize this based on your API
-            response = requests.post(api_url, json={"message": report})
+            response = _DELIVERY_SESSION.post(api_url, data=_dumps({"message": report}))
             response.raise_for_status()
             print("✅ Report sent via WhatsApp")
             return True
@@ -288,18 +462,17 @@ class ReportDelivery:
             return False
 
     @staticmethod
-    def send_email(report: str, config: Dict) -> bool:
+    def send_email(report: str, config: dict) -> bool:
         """Send report via Email"""
         try:
             import smtplib
-            from email.mime.text import MIMEText
-            from email.mime.multipart import MIMEMultipart
+            from email.message import EmailMessage
 
-            msg = MIMEMultipart()
+            msg = EmailMessage()
             msg['From'] = config['sender']
             msg['To'] = config['recipient']
             msg['Subject'] = f"Pelangi Daily Report - {datetime.now().strftime('%Y-%m-%d')}"
-            msg.attach(MIMEText(report, 'plain'))
+            msg.set_content(report, cte="base64")
 
             with smtplib.SMTP(config['smtp_server'], config['smtp_port']) as server:
                 server.starttls()
@@ -313,14 +486,14 @@ class ReportDelivery:
             return False
 
     @staticmethod
-    def save_to_file(report: str, filepath: str = None) -> bool:
-        """Save report to file as backup"""
+    def save_to_file(report: bytes, filepath: str | None = None) -> bool:
+        """Save UTF-8 encoded report to file as backup"""
         if not filepath:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filepath = f"pelangi_report_{timestamp}.txt"
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'wb') as f:
                 f.write(report)
             print(f"✅ Report saved to {filepath}")
             return True
@@ -329,46 +502,71 @@ class ReportDelivery:
             return False
 
 
+_mcp_client: MCPClient | None = None
+
+
+def get_mcp_client() -> MCPClient:
+    """Return the shared MCP client, creating it on first use"""
+    global _mcp_client
+    if _mcp_client is None:
+        _mcp_client = MCPClient(MCP_URL)
+    return _mcp_client
+
+
+async def _generate_report(generator: ReportGenerator, mcp: MCPClient, now: datetime) -> str:
+    """Generate the report, releasing MCP connections before the event loop closes"""
+    try:
+        return await generator.generate_report(now=now)
+    finally:
+        await mcp.aclose()
+
+
 def generate_and_send_report():
     """Main function to generate and send daily report"""
+    now = datetime.now(MALAYSIA_TZ)
+    ts_short = now.strftime('%Y-%m-%d %H:%M:%S')
+
     print(f"\n{'='*60}")
     print(f"Moltbot Report Generation Started")
-    print(f"Time: {datetime.now(MALAYSIA_TZ).strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Time: {ts_short}")
     print(f"{'='*60}\n")
 
-    # Initialize MCP client
-    mcp = MCPClient(MCP_URL)
+    # Reuse the MCP client across runs so its result cache stays warm
+    mcp = get_mcp_client()
 
     # Health check with retry
     max_retries = 3
     for attempt in range(max_retries):
         if mcp.health_check():
             print(f"✅ MCP server is healthy")
+            mcp.close_health_conn()
             break
         else:
             print(f"⚠️ MCP server health check failed (attempt {attempt + 1}/{max_retries})")
             if attempt < max_retries - 1:
-                time.sleep(5)
+                time.sleep(2 ** attempt)  # Exponential backoff: 1s, 2s
             else:
                 print("❌ MCP server unavailable after 3 attempts")
+                mcp.close_health_conn()
                 # Send alert notification
                 alert = f"""🚨 MOLTBOT ALERT
 Failed to connect to PelangiManager MCP server.
 Please check if the server is running.
-Time: {datetime.now(MALAYSIA_TZ).strftime('%Y-%m-%d %H:%M:%S')}"""
+Time: {ts_short}"""
                 ReportDelivery.send_telegram(alert, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID)
                 return
 
     # Generate report
     print("Generating report...")
     generator = ReportGenerator(mcp)
-    report = generator.generate_report()
+    report = asyncio.run(_generate_report(generator, mcp, now))
+    report_bytes = report.encode('utf-8')
 
     # Print to console
     print("\n" + report + "\n")
 
     # Save backup
-    ReportDelivery.save_to_file(report)
+    ReportDelivery.save_to_file(report_bytes)
 
     # Deliver via configured channels
     delivery_success = False
@@ -385,6 +583,7 @@ Time: {datetime.now(MALAYSIA_TZ).strftime('%Y-%m-%d %H:%M:%S')}"""
     if not delivery_success:
         print("⚠️ No delivery channels configured - report saved to file only")
 
+    print(f"MCP cache stats: {mcp.get_cache_stats()}")
     print(f"\n{'='*60}")
     print(f"Report generation completed")
     print(f"{'='*60}\n")
@@ -392,6 +591,8 @@ Time: {datetime.now(MALAYSIA_TZ).strftime('%Y-%m-%d %H:%M:%S')}"""
 
 def main():
     """Main entry point with scheduling"""
+    import schedule
+
     print("""
     ╔════════════════════════════════════════════════════════╗
     ║         MOLTBOT DAILY REPORT SCHEDULER v1.0            ║
@@ -410,10 +611,16 @@ def main():
     # Uncomment the line below to test
     # generate_and_send_report()
 
-    # Keep running
+    # Sleep until the next scheduled job instead of polling every minute.
+    # Cap each sleep at an hour: time.sleep runs on the monotonic clock, which
+    # stops during system suspend, so re-check wall time regularly.
     while True:
+        idle = schedule.idle_seconds()
+        if idle is None:
+            break  # No jobs scheduled
+        if idle > 0:
+            time.sleep(min(idle, 3600))
         schedule.run_pending()
-        time.sleep(60)  # Check every minute
 
 
 if __name__ == "__main__":